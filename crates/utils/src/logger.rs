@@ -1,3 +1,4 @@
+use std::fmt::Arguments;
 use std::io::Write;
 use std::sync::{Mutex, OnceLock};
 
@@ -73,7 +74,9 @@ impl Logger {
     /// 核心日志输出方法。
     ///
     /// 格式：`yyyy-MM-dd HH:mm:ss.SSS LEVEL --- [name] : msg`
-    pub fn log(&mut self, level: LogLevel, func: &str, msg: &str) {
+    ///
+    /// 消息以 `Arguments` 传入，级别被过滤时不会格式化。
+    pub fn log(&mut self, level: LogLevel, func: &str, args: Arguments) {
         if level < self.min_level {
             return;
         }
@@ -86,7 +89,8 @@ impl Logger {
         );
 
         let colored_level = level.colored_str();
-        let colored_msg = level.colorize_msg(msg);
+        let msg = args.to_string();
+        let colored_msg = level.colorize_msg(&msg);
 
         let line = format!(
             "{} {:<14} --- [{}] : {}\n",
@@ -129,9 +133,9 @@ pub fn set_log_target<W: Write + Send + 'static>(target: W) {
     }
 }
 
-pub fn log(level: LogLevel, func: &str, msg: &str) {
+pub fn log(level: LogLevel, func: &str, args: Arguments) {
     if let Ok(mut logger) = global_logger().lock() {
-        logger.log(level, func, msg);
+        logger.log(level, func, args);
     }
 }
 
@@ -146,7 +150,7 @@ macro_rules! log {
         $crate::logger::log(
             $level,
             $func,
-            &format!($($arg)*)
+            format_args!($($arg)*)
         )
     };
 }